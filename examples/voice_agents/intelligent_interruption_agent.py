@@ -32,7 +32,7 @@ from __future__ import annotations
 import logging
 import string
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import IntEnum
 from typing import Any, Callable
 
 from dotenv import load_dotenv
@@ -59,11 +59,11 @@ logging.basicConfig(level=logging.INFO)
 # Interruption Filter Implementation (embedded for standalone use)
 # ============================================================================
 
-class FilterAction(Enum):
+class FilterAction(IntEnum):
     """Actions the interruption filter can take."""
-    ALLOW = "allow"
-    FILTER = "filter"
-    PENDING = "pending"
+    ALLOW = 0
+    FILTER = 1
+    PENDING = 2
 
 
 @dataclass
@@ -89,6 +89,10 @@ DEFAULT_IGNORE_LIST = [
     "go on", "continue", "i see",
 ]
 
+# Punctuation-stripping table, built once instead of on every tokenize call
+_PUNCT_TRANSLATOR = str.maketrans("", "", string.punctuation)
+_PUNCT_SET = frozenset(string.punctuation)
+
 
 class InterruptionFilter:
     """
@@ -116,14 +120,26 @@ class InterruptionFilter:
             ignore_list = [word.lower() for word in ignore_list]
         
         self._ignore_set = set(ignore_list)
+        # Entries as the tokenizer sees them ("uh-huh" -> "uhhuh"); words of
+        # multi-word entries ("uh huh", "i see") are kept apart, since on their
+        # own they may still be the start or end of a phrase
+        self._phrase_words: set[str] = set()
+        for entry in ignore_list:
+            tokens = self._tokenize(entry)
+            if len(tokens) == 1:
+                self._ignore_set.add(tokens[0])
+            else:
+                self._phrase_words.update(tokens)
+        self._phrase_words -= self._ignore_set
     
     def _normalize_text(self, text: str) -> str:
         return text if self._case_sensitive else text.lower()
     
     def _tokenize(self, text: str) -> list[str]:
-        translator = str.maketrans('', '', string.punctuation)
-        cleaned = text.translate(translator)
-        return [word for word in cleaned.split() if word]
+        # ASR output is usually punctuation-free; skip the translate copy then
+        if _PUNCT_SET.isdisjoint(text):
+            return text.split()
+        return text.translate(_PUNCT_TRANSLATOR).split()
     
     def is_ignore_list_only(self, transcription: str) -> bool:
         """Check if transcription contains only backchanneling words."""
@@ -229,6 +245,45 @@ class InterruptionFilter:
         )
 
 
+class StreamingClassifier:
+    """
+    Spots command words in interim transcripts so a real interruption can be
+    allowed before the STT finalizes the utterance.
+    """
+    
+    def __init__(self, interruption_filter: InterruptionFilter) -> None:
+        self._filter = interruption_filter
+        self.reset()
+    
+    def reset(self) -> None:
+        """Clear state at an utterance boundary."""
+        self._prefix = ""
+        self._decided = False
+    
+    def feed(self, partial: str) -> bool:
+        """Return True the first time a completed word that can only be a command appears."""
+        if self._decided:
+            return False
+        
+        normalized = self._filter._normalize_text(partial)
+        # Only words before the last space are complete
+        end = normalized.rfind(" ")
+        if end < 0:
+            return False
+        
+        # Scan only what was appended since last time, unless the STT revised it
+        start = len(self._prefix) if normalized.startswith(self._prefix) else 0
+        self._prefix = normalized[:end + 1]
+        
+        ignore_set = self._filter._ignore_set
+        phrase_words = self._filter._phrase_words
+        for word in self._filter._tokenize(normalized[start:end]):
+            if word not in ignore_set and word not in phrase_words:
+                self._decided = True
+                return True
+        return False
+
+
 # ============================================================================
 # Agent Implementation
 # ============================================================================
@@ -253,6 +308,9 @@ class IntelligentInterruptionAgent(Agent):
             enabled=True,
             case_sensitive=False,
         )
+        # Bound once; called for every final transcript
+        self._filter_decide = self._interruption_filter.should_filter_interruption
+        self._partial_classifier = StreamingClassifier(self._interruption_filter)
         
         self._is_speaking = False
     
@@ -265,6 +323,21 @@ class IntelligentInterruptionAgent(Agent):
         self._is_speaking = speaking
         logger.debug(f"Agent speaking state: {speaking}")
     
+    def check_partial_transcript(self, transcript: str) -> bool:
+        """
+        Check an interim transcript while the agent is speaking.
+        
+        Returns True once per utterance when a command word shows up, without
+        waiting for the final transcript.
+        """
+        if not self._is_speaking:
+            return False
+        return self._partial_classifier.feed(transcript)
+    
+    def end_utterance(self) -> None:
+        """Reset interim-transcript tracking once a final transcript arrives."""
+        self._partial_classifier.reset()
+    
     def should_allow_interruption(self, transcript: str) -> bool:
         """
         Determine if user input should interrupt the agent.
@@ -272,7 +345,7 @@ class IntelligentInterruptionAgent(Agent):
         Returns True if the interruption should be allowed,
         False if it should be filtered (backchanneling).
         """
-        decision = self._interruption_filter.should_filter_interruption(
+        decision = self._filter_decide(
             transcription=transcript,
             agent_state="speaking" if self._is_speaking else "listening",
             agent_speaking=self._is_speaking,
@@ -333,10 +406,21 @@ async def entrypoint(ctx: JobContext):
         agent.set_speaking(is_speaking)
     
     # Log user transcriptions and filter decisions
+    should_allow_interruption = agent.should_allow_interruption
+    check_partial_transcript = agent.check_partial_transcript
+    
     @session.on("user_input_transcribed")
     def on_user_input(ev: UserInputTranscribedEvent):
-        if ev.is_final and ev.transcript.strip():
-            should_allow = agent.should_allow_interruption(ev.transcript)
+        if not ev.is_final:
+            # Interim results: log a command as soon as it is clear; the
+            # interruption itself is still decided on the final transcript
+            if check_partial_transcript(ev.transcript):
+                logger.info(f"Command detected in partial transcript: '{ev.transcript}'")
+            return
+        
+        agent.end_utterance()
+        if ev.transcript.strip():
+            should_allow = should_allow_interruption(ev.transcript)
             logger.info(
                 f"User said: '{ev.transcript}' | "
                 f"Agent speaking: {agent._is_speaking} | "
@@ -8,27 +8,68 @@ based on the agent's current speaking state.
 
 from __future__ import annotations
 
+import functools
+import re
+import string
+import sys
 import time
+from collections.abc import Iterable, Mapping, Sequence
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import IntEnum
 from typing import Any, Callable
 
 from ..log import logger
 
 
-class FilterAction(Enum):
-    """Actions the interruption filter can take."""
+class FilterAction(IntEnum):
+    """
+    Actions the interruption filter can take.
+    
+    Integer-valued so comparisons on the decision path are plain int
+    compares; use ``action.name.lower()`` for a display label.
+    """
+    
+    ALLOW = 0  # Allow the interruption
+    FILTER = 1  # Block the interruption
+    PENDING = 2  # Waiting for more information
+
+
+class _ReadOnlyMetadata(dict[str, Any]):
+    """
+    A dict that rejects mutation, so decision metadata can be shared.
+    
+    Unlike ``types.MappingProxyType`` it still pickles, deep-copies, and
+    serializes to JSON like a plain dict.
+    """
     
-    ALLOW = "allow"  # Allow the interruption
-    FILTER = "filter"  # Block the interruption
-    PENDING = "pending"  # Waiting for more information
+    __slots__ = ()
+    
+    def _raise_error(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError("decision metadata is read-only")
+    
+    # override all mutating methods to raise errors
+    clear = pop = popitem = setdefault = update = _raise_error  # type: ignore
+    __setitem__ = __delitem__ = __ior__ = _raise_error  # type: ignore
+    
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Rebuild through __init__ instead of item assignment
+        return (type(self), (dict(self),))
+
+
+# Shared read-only empty mapping, the default metadata of every decision
+_EMPTY_METADATA: Mapping[str, Any] = _ReadOnlyMetadata()
 
+# dataclass(slots=True) is only available on Python 3.10+
+_DATACLASS_SLOTS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class FilterDecision:
     """
     Represents the result of an interruption filtering decision.
     
+    Decisions are immutable and may be shared between calls.
+    
     Attributes:
         action: The action to take (ALLOW, FILTER, PENDING)
         reason: Human-readable explanation of the decision
@@ -38,11 +79,11 @@ class FilterDecision:
     action: FilterAction
     reason: str
     confidence: float = 1.0
-    metadata: dict[str, Any] = field(default_factory=dict)
+    metadata: Mapping[str, Any] = field(default_factory=lambda: _EMPTY_METADATA)
 
 
-# Default list of common backchanneling words
-DEFAULT_IGNORE_LIST = [
+# Default backchanneling words, in their original order
+DEFAULT_IGNORE_LIST_ORDERED: tuple[str, ...] = (
     # Single syllable acknowledgements
     "yeah", "yep", "yes", "yup", "ok", "okay",
     "hmm", "mhm", "mm", "mmm", "uh-huh", "uh huh",
@@ -56,10 +97,64 @@ DEFAULT_IGNORE_LIST = [
     
     # Encouragement
     "go on", "continue", "i see",
-]
+)
 
+# Default backchanneling words as a set, for O(1) membership checks
+DEFAULT_IGNORE_LIST: frozenset[str] = frozenset(DEFAULT_IGNORE_LIST_ORDERED)
+
+class _LowercaseIgnoreList(tuple[str, ...]):
+    """An ignore list already lowercased, so validation can skip it."""
+    
+    __slots__ = ()
 
-@dataclass
+
+# Lowercased default, shared by configs and filters so constructing either
+# never copies or re-normalizes the list
+_DEFAULT_IGNORE_LOWER = _LowercaseIgnoreList(
+    word.lower() for word in DEFAULT_IGNORE_LIST_ORDERED
+)
+
+# Word tokenizer: runs of word characters, allowing inner apostrophes/hyphens
+# ("uh-huh", "don't") so punctuation is dropped without a separate strip pass
+_WORD_RE = re.compile(r"\w+(?:['-]\w+)*")
+
+# Characters trimmed from a lone token on the single-word fast path; "_" is
+# a word character to _WORD_RE, so it must stay part of the token
+_PUNCT_WS = string.punctuation.replace("_", "") + string.whitespace
+
+# Allowed range for InterruptionFilterConfig.buffer_time, in seconds
+_BUFFER_TIME_RANGE = (0.0, 2.0)
+
+# Number of distinct transcripts whose classification is memoized per filter
+_CLASSIFY_CACHE_SIZE = 512
+
+# Number of raw transcripts whose agent-speaking decision is memoized per filter
+_DECISION_CACHE_SIZE = 256
+
+# Longest transcript (in characters) whose classification or decision is
+# memoized; only backchannel-sized utterances repeat often enough to be worth
+# keeping, so the caches never hold long user speech
+_CACHE_MAX_LEN = 32
+
+# Number of distinct ignore lists whose lookup index is kept for reuse
+_IGNORE_INDEX_CACHE_SIZE = 32
+
+
+class BufferTimeRangeError(ValueError):
+    """Raised when InterruptionFilterConfig.buffer_time is out of range."""
+    
+    def __init__(self) -> None:
+        super().__init__("buffer_time must be between 0 and 2.0 seconds")
+
+
+class EmptyIgnoreListError(ValueError):
+    """Raised when filtering is enabled with an empty ignore list."""
+    
+    def __init__(self) -> None:
+        super().__init__("ignore_list cannot be empty when filtering is enabled")
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class InterruptionFilterConfig:
     """
     Configuration for interruption filtering.
@@ -73,23 +168,142 @@ class InterruptionFilterConfig:
         emit_events: Whether to emit filtering events
     """
     enabled: bool = True
-    ignore_list: list[str] = field(default_factory=lambda: DEFAULT_IGNORE_LIST.copy())
+    ignore_list: Sequence[str] = DEFAULT_IGNORE_LIST_ORDERED
     case_sensitive: bool = False
     buffer_time: float = 0.5
     custom_filter: Callable[[str, str], bool] | None = None
     emit_events: bool = True
     
     def validate(self) -> None:
-        """Validate configuration parameters."""
-        if self.buffer_time < 0 or self.buffer_time > 2.0:
-            raise ValueError("buffer_time must be between 0 and 2.0 seconds")
+        """
+        Validate configuration parameters.
+        
+        Raises:
+            BufferTimeRangeError: If buffer_time is outside the allowed range
+            EmptyIgnoreListError: If filtering is enabled with no ignore words
+        
+        When case-insensitive, the ignore list is replaced by a lowercased
+        tuple, which later calls recognize and leave as is.
+        """
+        low, high = _BUFFER_TIME_RANGE
+        if not low <= self.buffer_time <= high:
+            raise BufferTimeRangeError()
         
         if self.enabled and not self.ignore_list:
-            raise ValueError("ignore_list cannot be empty when filtering is enabled")
+            raise EmptyIgnoreListError()
         
-        # Normalize ignore list
-        if not self.case_sensitive:
-            self.ignore_list = [word.lower() for word in self.ignore_list]
+        # Normalize ignore list, skipping lists that are already normalized
+        if not self.case_sensitive and not isinstance(self.ignore_list, _LowercaseIgnoreList):
+            if self.ignore_list is DEFAULT_IGNORE_LIST_ORDERED:
+                self.ignore_list = _DEFAULT_IGNORE_LOWER
+            else:
+                self.ignore_list = _LowercaseIgnoreList(word.lower() for word in self.ignore_list)
+
+
+# Shared decisions for outcomes that carry no per-call data; callers must
+# treat them (and their metadata) as read-only
+_DECISION_DISABLED = FilterDecision(
+    action=FilterAction.ALLOW,
+    reason="Filtering disabled",
+    confidence=1.0,
+)
+_DECISION_CUSTOM_FILTER = FilterDecision(
+    action=FilterAction.FILTER,
+    reason="Custom filter decision",
+    confidence=1.0,
+    metadata=_ReadOnlyMetadata({"custom_filter": True}),
+)
+_DECISION_CUSTOM_ALLOW = FilterDecision(
+    action=FilterAction.ALLOW,
+    reason="Custom filter decision",
+    confidence=1.0,
+    metadata=_ReadOnlyMetadata({"custom_filter": True}),
+)
+_DECISION_AGENT_SILENT = FilterDecision(
+    action=FilterAction.ALLOW,
+    reason="Agent not speaking, processing as user input",
+    confidence=1.0,
+    metadata=_ReadOnlyMetadata({"agent_speaking": False}),
+)
+_DECISION_DEFAULT_ALLOW = FilterDecision(
+    action=FilterAction.ALLOW,
+    reason="Default allow",
+    confidence=0.5,
+)
+
+# Metadata-free variants used when the filter does not emit events, so no
+# reference to the transcript is retained on the decision
+_DECISION_BACKCHANNEL = FilterDecision(
+    action=FilterAction.FILTER,
+    reason="Backchanneling detected while agent speaking",
+    confidence=1.0,
+    metadata=_EMPTY_METADATA,
+)
+_DECISION_COMMAND = FilterDecision(
+    action=FilterAction.ALLOW,
+    reason="Command words detected, allowing interruption",
+    confidence=1.0,
+    metadata=_EMPTY_METADATA,
+)
+
+
+def _remember(memo: dict[str, Any], key: str, value: Any, maxsize: int) -> None:
+    """Store a value in a bounded memo, evicting the oldest entry when full."""
+    if len(memo) >= maxsize:
+        del memo[next(iter(memo))]
+    memo[key] = value
+
+
+def _identity(text: str) -> str:
+    """Return text unchanged (normalizer for case-sensitive filters)."""
+    return text
+
+
+@functools.lru_cache(maxsize=_IGNORE_INDEX_CACHE_SIZE)
+def _build_ignore_index(
+    entries: tuple[str, ...],
+) -> tuple[frozenset[str], frozenset[str], dict[str, tuple[tuple[str, ...], ...]]]:
+    """
+    Build the lookup structures for a normalized ignore list.
+    
+    Memoized on the list's contents, so identical lists (most commonly the
+    default one) are only processed once per process.
+    
+    Args:
+        entries: Ignore list entries, already normalized
+        
+    Returns:
+        Tuple of (single words, phrase-only words, phrases keyed by first word)
+    """
+    # Split entries into single words and multi-word phrases ("uh huh",
+    # "go on"), tokenized the same way as transcripts so both sides agree
+    ignore_words: set[str] = set()
+    phrases_by_first: dict[str, set[tuple[str, ...]]] = {}
+    for entry in entries:
+        # Intern the static side so lookups can hit the identity fast path
+        tokens = [sys.intern(token) for token in _WORD_RE.findall(entry)]
+        if len(tokens) == 1:
+            ignore_words.add(tokens[0])
+        elif tokens:
+            phrases_by_first.setdefault(tokens[0], set()).add(tuple(tokens))
+    
+    # Single words as an immutable set for O(1) lookup
+    ignore_set = frozenset(ignore_words)
+    # Words that only occur inside phrases ("huh", "see"); on their own
+    # they are ambiguous until the rest of the phrase is known
+    phrase_words = frozenset(
+        token
+        for phrases in phrases_by_first.values()
+        for phrase in phrases
+        for token in phrase
+    ) - ignore_set
+    # Phrases keyed by first word, longest first
+    ignore_phrases = {
+        first: tuple(sorted(phrases, key=len, reverse=True))
+        for first, phrases in phrases_by_first.items()
+    }
+    
+    return ignore_set, phrase_words, ignore_phrases
 
 
 class InterruptionFilter:
@@ -102,10 +316,11 @@ class InterruptionFilter:
     
     def __init__(
         self,
-        ignore_list: list[str] | None = None,
+        ignore_list: Iterable[str] | None = None,
         custom_filter_fn: Callable[[str, str], bool] | None = None,
         enabled: bool = True,
         case_sensitive: bool = False,
+        emit_events: bool = True,
     ) -> None:
         """
         Initialize the interruption filter.
@@ -115,57 +330,127 @@ class InterruptionFilter:
             custom_filter_fn: Optional custom filtering logic
             enabled: Whether to enable filtering
             case_sensitive: Whether to perform case-sensitive matching
+            emit_events: Whether decisions carry event metadata (e.g. the transcription)
         """
         self._enabled = enabled
         self._case_sensitive = case_sensitive
+        # Chosen once so the hot path never branches on case sensitivity
+        self._normalize: Callable[[str], str] = _identity if case_sensitive else str.lower
         self._custom_filter_fn = custom_filter_fn
+        self._emit_events = emit_events
         
-        # Use default ignore list if none provided
+        # Use the default ignore list if none provided; its lowercased form is
+        # precomputed so the common construction path skips normalization
         if ignore_list is None:
-            ignore_list = DEFAULT_IGNORE_LIST.copy()
+            entries = DEFAULT_IGNORE_LIST_ORDERED if case_sensitive else _DEFAULT_IGNORE_LOWER
+        elif case_sensitive:
+            entries = tuple(ignore_list)
+        else:
+            entries = tuple(word.lower() for word in ignore_list)
         
-        # Normalize to lowercase if case-insensitive
-        if not case_sensitive:
-            ignore_list = [word.lower() for word in ignore_list]
+        # Shared per distinct ignore list, so filters built for each session
+        # reuse the same sets and phrase table
+        self._ignore_set, self._phrase_words, self._ignore_phrases = _build_ignore_index(entries)
+        # Any word longer than this is a command without a set lookup
+        self._max_ignore_len = max(map(len, self._ignore_set | self._phrase_words), default=0)
         
-        # Convert to set for O(1) lookup
-        self._ignore_set = set(ignore_list)
+        # Memoize classification of short normalized text per instance; ASR
+        # re-emits the same backchannels ("yeah", "ok") many times a session.
+        # Plain dicts rather than lru_cache around bound methods, which would
+        # make every filter a reference cycle only the cyclic GC can free
+        self._classify_memo: dict[str, tuple[bool, bool, bool]] = {}
+        # Whole decisions for the agent-speaking path, keyed on the raw
+        # transcript since decision metadata carries it verbatim. Without
+        # events the decisions are shared singletons already, so this stays
+        # empty and only the short normalized transcripts above are retained
+        self._decision_memo: dict[str, FilterDecision] = {}
         
         logger.debug(
             "InterruptionFilter initialized",
             extra={
                 "enabled": enabled,
-                "ignore_list_size": len(self._ignore_set),
+                "ignore_list_size": len(entries),
                 "case_sensitive": case_sensitive,
             }
         )
     
     def _normalize_text(self, text: str) -> str:
         """Normalize text based on case sensitivity setting."""
-        return text if self._case_sensitive else text.lower()
+        return self._normalize(text)
     
-    def _tokenize(self, text: str) -> list[str]:
+    def _single_token(self, normalized: str) -> str | None:
         """
-        Tokenize text into words.
+        Extract the token from a single-word transcription.
         
         Args:
-            text: The text to tokenize
+            normalized: The transcription, already normalized
             
         Returns:
-            List of words
+            The token, or None if the transcription is empty or has several words
+        """
+        token = normalized.strip(_PUNCT_WS)
+        if not token or " " in token:
+            return None
+        return token
+    
+    def _classify(self, normalized: str) -> tuple[bool, bool, bool]:
         """
-        # Simple whitespace-based tokenization
-        # Remove punctuation and split on whitespace
-        import string
+        Classify a transcription in a single tokenize pass.
+        
+        Args:
+            normalized: The transcription, already normalized
+            
+        Returns:
+            Tuple of (has_words, ignore_list_only, has_command_words)
+        """
+        words = _WORD_RE.findall(normalized)
+        if not words:
+            return (False, False, False)
         
-        # Remove punctuation
-        translator = str.maketrans('', '', string.punctuation)
-        cleaned = text.translate(translator)
+        # Set-level checks run in C and settle most transcripts without a
+        # Python loop: all words ignored, or no word can start a phrase
+        ignore_set = self._ignore_set
+        if ignore_set.issuperset(words):
+            return (True, True, False)
         
-        # Split and filter empty strings
-        words = [word for word in cleaned.split() if word]
+        ignore_phrases = self._ignore_phrases
+        if ignore_phrases.keys().isdisjoint(words):
+            return (True, False, True)
         
-        return words
+        # Word positions up to which the transcript splits into ignore entries.
+        # Each position is expanded once, so overlapping entries ("yeah",
+        # "ok", "yeah ok") keep the walk linear in the number of words
+        reachable = {0}
+        for i, word in enumerate(words):
+            if i not in reachable:
+                continue
+            if word in ignore_set:
+                reachable.add(i + 1)
+            for phrase in ignore_phrases.get(word, ()):
+                end = i + len(phrase)
+                if tuple(words[i:end]) == phrase:
+                    reachable.add(end)
+        
+        if len(words) in reachable:
+            return (True, True, False)
+        return (True, False, True)
+    
+    def _classify_cached(self, normalized: str) -> tuple[bool, bool, bool]:
+        """
+        Classify a transcription, memoizing results for short transcripts.
+        
+        Args:
+            normalized: The transcription, already normalized
+            
+        Returns:
+            Tuple of (has_words, ignore_list_only, has_command_words)
+        """
+        result = self._classify_memo.get(normalized)
+        if result is None:
+            result = self._classify(normalized)
+            if len(normalized) <= _CACHE_MAX_LEN:
+                _remember(self._classify_memo, normalized, result, _CLASSIFY_CACHE_SIZE)
+        return result
     
     def is_ignore_list_only(self, transcription: str) -> bool:
         """
@@ -177,18 +462,7 @@ class InterruptionFilter:
         Returns:
             True if all words are in ignore list, False otherwise
         """
-        if not transcription or not transcription.strip():
-            return False
-        
-        # Normalize and tokenize
-        normalized = self._normalize_text(transcription)
-        words = self._tokenize(normalized)
-        
-        if not words:
-            return False
-        
-        # Check if all words are in ignore list
-        return all(word in self._ignore_set for word in words)
+        return self._classify_cached(self._normalize(transcription))[1]
     
     def has_command_words(self, transcription: str) -> bool:
         """
@@ -200,18 +474,7 @@ class InterruptionFilter:
         Returns:
             True if any word is not in ignore list, False otherwise
         """
-        if not transcription or not transcription.strip():
-            return False
-        
-        # Normalize and tokenize
-        normalized = self._normalize_text(transcription)
-        words = self._tokenize(normalized)
-        
-        if not words:
-            return False
-        
-        # Check if any word is NOT in ignore list
-        return any(word not in self._ignore_set for word in words)
+        return self._classify_cached(self._normalize(transcription))[2]
     
     def should_filter_interruption(
         self,
@@ -230,23 +493,22 @@ class InterruptionFilter:
         Returns:
             FilterDecision with action (ALLOW, FILTER, PENDING) and reason
         """
+        # Loaded once; a local also lets type checkers narrow the Optional
+        custom_filter_fn = self._custom_filter_fn
+        
+        # Dominant case: input while the agent is silent is always allowed,
+        # unless a custom filter gets a say over it
+        if not agent_speaking and custom_filter_fn is None:
+            return _DECISION_AGENT_SILENT
+        
         if not self._enabled:
-            return FilterDecision(
-                action=FilterAction.ALLOW,
-                reason="Filtering disabled",
-                confidence=1.0
-            )
+            return _DECISION_DISABLED
         
         # If custom filter provided, use it
-        if self._custom_filter_fn is not None:
+        if custom_filter_fn is not None:
             try:
-                should_filter = self._custom_filter_fn(transcription, agent_state)
-                return FilterDecision(
-                    action=FilterAction.FILTER if should_filter else FilterAction.ALLOW,
-                    reason="Custom filter decision",
-                    confidence=1.0,
-                    metadata={"custom_filter": True}
-                )
+                should_filter = custom_filter_fn(transcription, agent_state)
+                return _DECISION_CUSTOM_FILTER if should_filter else _DECISION_CUSTOM_ALLOW
             except Exception as e:
                 logger.error(
                     "Error in custom filter function, falling back to default",
@@ -257,42 +519,188 @@ class InterruptionFilter:
         
         # If agent is not speaking, always allow (process as valid input)
         if not agent_speaking:
-            return FilterDecision(
-                action=FilterAction.ALLOW,
-                reason="Agent not speaking, processing as user input",
-                confidence=1.0,
-                metadata={"agent_speaking": False}
-            )
+            return _DECISION_AGENT_SILENT
+        
+        # Agent is speaking - decisions depend only on the transcript here
+        decision = self._decision_memo.get(transcription)
+        if decision is None:
+            decision = self._decide_speaking(transcription)
+            if self._emit_events and len(transcription) <= _CACHE_MAX_LEN:
+                _remember(self._decision_memo, transcription, decision, _DECISION_CACHE_SIZE)
+        return decision
+    
+    def _decide_speaking(self, transcription: str) -> FilterDecision:
+        """
+        Decide an interruption while the agent is speaking.
         
-        # Agent is speaking - check if input is ignore-list-only
-        if self.is_ignore_list_only(transcription):
+        Args:
+            transcription: The user's transcribed speech
+            
+        Returns:
+            FilterDecision for the transcript (shared between calls via the memo)
+        """
+        # Normalize once; a lone backchannel token ("ok", "Yeah.") is looked
+        # up directly, anything else is classified in one pass
+        normalized = self._normalize(transcription)
+        token = self._single_token(normalized)
+        if token is not None and token in self._ignore_set:
+            ignore_list_only, has_command_words = True, False
+        else:
+            _, ignore_list_only, has_command_words = self._classify_cached(normalized)
+        
+        if ignore_list_only:
+            if not self._emit_events:
+                return _DECISION_BACKCHANNEL
             return FilterDecision(
                 action=FilterAction.FILTER,
                 reason="Backchanneling detected while agent speaking",
                 confidence=1.0,
-                metadata={
+                metadata=_ReadOnlyMetadata({
                     "agent_speaking": True,
                     "ignore_list_only": True,
                     "transcription": transcription
-                }
+                })
             )
         
         # Agent is speaking but input contains command words
-        if self.has_command_words(transcription):
+        if has_command_words:
+            if not self._emit_events:
+                return _DECISION_COMMAND
             return FilterDecision(
                 action=FilterAction.ALLOW,
                 reason="Command words detected, allowing interruption",
                 confidence=1.0,
-                metadata={
+                metadata=_ReadOnlyMetadata({
                     "agent_speaking": True,
                     "has_command_words": True,
                     "transcription": transcription
-                }
+                })
             )
         
         # Default to allowing interruption
-        return FilterDecision(
-            action=FilterAction.ALLOW,
-            reason="Default allow",
-            confidence=0.5
-        )
+        return _DECISION_DEFAULT_ALLOW
+    
+    def classify_batch(
+        self,
+        transcriptions: Sequence[str],
+        agent_speaking: Sequence[bool],
+        agent_states: Sequence[str] | None = None,
+    ) -> list[FilterDecision]:
+        """
+        Decide a batch of interruptions, e.g. when replaying an evaluation dataset.
+        
+        Repeated transcripts in the batch share the classification cache, so
+        each distinct utterance is matched once.
+        
+        Args:
+            transcriptions: The user's transcribed utterances
+            agent_speaking: Whether the agent was speaking for each utterance
+            agent_states: Agent state per utterance (derived from agent_speaking if None)
+            
+        Returns:
+            One FilterDecision per transcription, in order
+        """
+        if len(agent_speaking) != len(transcriptions):
+            raise ValueError("agent_speaking must have one entry per transcription")
+        
+        if agent_states is None:
+            agent_states = ["speaking" if speaking else "listening" for speaking in agent_speaking]
+        elif len(agent_states) != len(transcriptions):
+            raise ValueError("agent_states must have one entry per transcription")
+        
+        decide = self.should_filter_interruption
+        return [
+            decide(transcription, agent_state, speaking)
+            for transcription, agent_state, speaking in zip(
+                transcriptions, agent_states, agent_speaking
+            )
+        ]
+
+
+class StreamingInterruptionClassifier:
+    """
+    Detects command words in partial (interim) transcripts of one utterance.
+    
+    Waiting for the final transcript adds the STT finalization delay to every
+    real interruption. This classifier is fed each interim hypothesis and
+    returns an ALLOW decision as soon as a completed word is seen that can
+    only be a command, so the agent can yield before the final arrives.
+    Backchannels are never decided early; those still go through
+    ``InterruptionFilter.should_filter_interruption`` on the final transcript.
+    """
+    
+    def __init__(self, interruption_filter: InterruptionFilter) -> None:
+        """
+        Initialize the streaming classifier.
+        
+        Args:
+            interruption_filter: Filter whose ignore list and settings are used
+        """
+        self._filter = interruption_filter
+        self.reset()
+    
+    def reset(self) -> None:
+        """Clear state at an utterance boundary (e.g. after a final transcript)."""
+        self._prefix = ""
+        self._decided = False
+    
+    def feed(self, partial: str, agent_speaking: bool) -> FilterDecision | None:
+        """
+        Process the latest interim transcript of the current utterance.
+        
+        Only words completed since the previous call are scanned; if the STT
+        revised an earlier part of the hypothesis, the whole text is rescanned.
+        The trailing word is skipped while it may still be growing.
+        
+        Args:
+            partial: The interim transcript so far (cumulative)
+            agent_speaking: Whether agent is currently speaking
+            
+        Returns:
+            An ALLOW decision the first time a command word is seen, else None
+        """
+        interruption_filter = self._filter
+        if (
+            self._decided
+            or not agent_speaking
+            or not interruption_filter._enabled
+            or interruption_filter._custom_filter_fn is not None
+        ):
+            return None
+        
+        normalized = interruption_filter._normalize(partial)
+        
+        # Words before the last space are complete
+        end = normalized.rfind(" ")
+        if end < 0:
+            return None
+        
+        # Resume after the previously scanned prefix unless it was revised
+        start = len(self._prefix) if normalized.startswith(self._prefix) else 0
+        self._prefix = normalized[:end + 1]
+        
+        ignore_set = interruption_filter._ignore_set
+        phrase_words = interruption_filter._phrase_words
+        max_ignore_len = interruption_filter._max_ignore_len
+        for word in _WORD_RE.findall(normalized, start, end):
+            # Length check first: a word longer than every ignore word is a
+            # command without any set lookup
+            if len(word) > max_ignore_len or (
+                word not in ignore_set and word not in phrase_words
+            ):
+                self._decided = True
+                if not interruption_filter._emit_events:
+                    return _DECISION_COMMAND
+                return FilterDecision(
+                    action=FilterAction.ALLOW,
+                    reason="Command words detected in partial transcript, allowing interruption",
+                    confidence=1.0,
+                    metadata=_ReadOnlyMetadata({
+                        "agent_speaking": True,
+                        "has_command_words": True,
+                        "partial": True,
+                        "transcription": partial
+                    })
+                )
+        
+        return None
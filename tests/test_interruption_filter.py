@@ -2,17 +2,40 @@
 Unit tests for intelligent interruption filtering.
 """
 
+import copy
+import dataclasses
+import gc
+import json
+import pickle
+import sys
+import weakref
+
 import pytest
 
 from livekit.agents.voice.interruption_filter import (
+    _CLASSIFY_CACHE_SIZE,
     DEFAULT_IGNORE_LIST,
+    DEFAULT_IGNORE_LIST_ORDERED,
+    BufferTimeRangeError,
+    EmptyIgnoreListError,
     FilterAction,
     FilterDecision,
     InterruptionFilter,
     InterruptionFilterConfig,
+    StreamingInterruptionClassifier,
 )
 
 
+class TestFilterAction:
+    """Tests for FilterAction enum."""
+    
+    def test_filter_action_is_int(self):
+        """Test actions are distinct integers with lowercase display names."""
+        assert [int(action) for action in FilterAction] == [0, 1, 2]
+        assert FilterAction.FILTER == 1
+        assert FilterAction.ALLOW.name.lower() == "allow"
+
+
 class TestFilterDecision:
     """Tests for FilterDecision dataclass."""
     
@@ -39,6 +62,30 @@ class TestFilterDecision:
         
         assert decision.confidence == 1.0
         assert decision.metadata == {}
+    
+    def test_filter_decision_default_metadata_shared(self):
+        """Test the default metadata is one shared, read-only empty mapping."""
+        first = FilterDecision(action=FilterAction.ALLOW, reason="a")
+        second = FilterDecision(action=FilterAction.FILTER, reason="b")
+        
+        assert first.metadata is second.metadata
+        with pytest.raises(TypeError):
+            first.metadata["key"] = "value"
+    
+    def test_filter_decision_copies(self):
+        """Test decisions survive asdict, pickle and deepcopy."""
+        decision = FilterDecision(action=FilterAction.ALLOW, reason="Test")
+        
+        assert dataclasses.asdict(decision)["metadata"] == {}
+        assert pickle.loads(pickle.dumps(decision)) == decision
+        assert copy.deepcopy(decision) == decision
+    
+    def test_filter_decision_is_frozen(self):
+        """Test FilterDecision instances cannot be mutated."""
+        decision = FilterDecision(action=FilterAction.ALLOW, reason="Test")
+        
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            decision.action = FilterAction.FILTER
 
 
 class TestInterruptionFilterConfig:
@@ -55,6 +102,39 @@ class TestInterruptionFilterConfig:
         assert config.custom_filter is None
         assert config.emit_events is True
     
+    def test_config_default_ignore_list_shared(self):
+        """Test configs share an immutable default ignore list instead of copying."""
+        first = InterruptionFilterConfig()
+        second = InterruptionFilterConfig()
+        
+        assert isinstance(first.ignore_list, tuple)
+        assert first.ignore_list is second.ignore_list
+        assert first.ignore_list == DEFAULT_IGNORE_LIST_ORDERED
+    
+    def test_config_fields_are_public(self):
+        """Test validate() keeps no private state among the dataclass fields."""
+        config = InterruptionFilterConfig(ignore_list=["YEAH"])
+        config.validate()
+        
+        assert [f.name for f in dataclasses.fields(config)] == [
+            "enabled",
+            "ignore_list",
+            "case_sensitive",
+            "buffer_time",
+            "custom_filter",
+            "emit_events",
+        ]
+        assert dataclasses.asdict(config)["ignore_list"] == ("yeah",)
+    
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+    def test_config_uses_slots(self):
+        """Test config instances have no per-instance __dict__."""
+        config = InterruptionFilterConfig()
+        
+        assert not hasattr(config, "__dict__")
+        with pytest.raises(AttributeError):
+            config.unknown_option = True
+    
     def test_config_validation_valid(self):
         """Test validation with valid configuration."""
         config = InterruptionFilterConfig(
@@ -89,6 +169,14 @@ class TestInterruptionFilterConfig:
         with pytest.raises(ValueError, match="ignore_list cannot be empty"):
             config.validate()
     
+    def test_config_validation_error_types(self):
+        """Test validation errors are ValueError subclasses per failure."""
+        with pytest.raises(BufferTimeRangeError):
+            InterruptionFilterConfig(buffer_time=3.0).validate()
+        
+        with pytest.raises(EmptyIgnoreListError):
+            InterruptionFilterConfig(ignore_list=[]).validate()
+    
     def test_config_validation_empty_ignore_list_disabled(self):
         """Test validation allows empty ignore list when disabled."""
         config = InterruptionFilterConfig(
@@ -113,6 +201,28 @@ class TestInterruptionFilterConfig:
         assert "hmm" in config.ignore_list
         assert "YEAH" not in config.ignore_list
     
+    def test_config_validate_normalizes_once(self):
+        """Test repeated validate() calls reuse the already-normalized list."""
+        config = InterruptionFilterConfig(ignore_list=["YEAH", "Ok"])
+        
+        config.validate()
+        normalized = config.ignore_list
+        config.validate()
+        
+        assert config.ignore_list is normalized
+        assert list(config.ignore_list) == ["yeah", "ok"]
+        
+        config.ignore_list = ["HMM"]
+        config.validate()
+        assert list(config.ignore_list) == ["hmm"]
+    
+    def test_config_validation_nan_buffer_time(self):
+        """Test validation rejects a NaN buffer time."""
+        config = InterruptionFilterConfig(buffer_time=float("nan"))
+        
+        with pytest.raises(ValueError, match="buffer_time must be between"):
+            config.validate()
+    
     def test_config_case_preservation(self):
         """Test ignore list preserves case when case-sensitive."""
         config = InterruptionFilterConfig(
@@ -141,6 +251,12 @@ class TestDefaultIgnoreList:
         for word in expected_words:
             assert word in DEFAULT_IGNORE_LIST, f"Expected '{word}' in default ignore list"
     
+    def test_default_ignore_list_ordered_view(self):
+        """Test the ordered tuple view holds the same words as the set."""
+        assert isinstance(DEFAULT_IGNORE_LIST, frozenset)
+        assert frozenset(DEFAULT_IGNORE_LIST_ORDERED) == DEFAULT_IGNORE_LIST
+        assert DEFAULT_IGNORE_LIST_ORDERED[0] == "yeah"
+    
     def test_default_ignore_list_all_lowercase(self):
         """Test all words in default ignore list are lowercase."""
         for word in DEFAULT_IGNORE_LIST:
@@ -166,6 +282,15 @@ class TestInterruptionFilterInitialization:
         assert "test" in filter._ignore_set
         assert "words" in filter._ignore_set
     
+    def test_filter_accepts_any_iterable(self):
+        """Test ignore_list may be any iterable of strings."""
+        filter = InterruptionFilter(
+            ignore_list=(word for word in ["Yeah", "ok"]),
+            case_sensitive=True
+        )
+        
+        assert filter._ignore_set == {"Yeah", "ok"}
+    
     def test_filter_case_insensitive_normalization(self):
         """Test filter normalizes ignore list to lowercase."""
         filter = InterruptionFilter(
@@ -188,6 +313,24 @@ class TestInterruptionFilterInitialization:
         assert "Ok" in filter._ignore_set
         assert "HMM" in filter._ignore_set
     
+    def test_max_ignore_len(self):
+        """Test the longest ignore/phrase word length is tracked."""
+        assert InterruptionFilter(ignore_list=["ok", "uh-huh", "go on"])._max_ignore_len == 6
+        assert InterruptionFilter(ignore_list=["ok", "i understand"])._max_ignore_len == 10
+        assert InterruptionFilter(ignore_list=[])._max_ignore_len == 0
+    
+    def test_filters_share_ignore_index(self):
+        """Test filters with the same ignore list reuse one lookup index."""
+        first = InterruptionFilter()
+        second = InterruptionFilter(
+            ignore_list=[word.upper() for word in DEFAULT_IGNORE_LIST_ORDERED]
+        )
+        custom = InterruptionFilter(ignore_list=["yeah"])
+        
+        assert first._ignore_set is second._ignore_set
+        assert first._ignore_phrases is second._ignore_phrases
+        assert custom._ignore_set is not first._ignore_set
+    
     def test_filter_disabled(self):
         """Test filter can be disabled."""
         filter = InterruptionFilter(enabled=False)
@@ -240,6 +383,38 @@ class TestInterruptionFilterIsIgnoreListOnly:
         assert filter.is_ignore_list_only("yeah!") is True
         assert filter.is_ignore_list_only("ok.") is True
         assert filter.is_ignore_list_only("yeah, ok!") is True
+    
+    def test_hyphenated_ignore_word(self):
+        """Test hyphenated entries like "uh-huh" match as a single word."""
+        filter = InterruptionFilter()
+        
+        assert filter.is_ignore_list_only("uh-huh") is True
+        assert filter.is_ignore_list_only("Uh-huh, yeah.") is True
+        assert filter.is_ignore_list_only("ok...yeah") is True
+    
+    def test_multi_word_phrases(self):
+        """Test multi-word entries like "uh huh" and "go on" are matched."""
+        filter = InterruptionFilter()
+        
+        assert filter.is_ignore_list_only("uh huh") is True
+        assert filter.is_ignore_list_only("Go on, I see.") is True
+        assert filter.is_ignore_list_only("yeah got it") is True
+        assert filter.is_ignore_list_only("go away") is False
+        assert filter.is_ignore_list_only("i") is False
+    
+    def test_overlapping_phrases(self):
+        """Test phrases that overlap single-word entries stay linear and exact."""
+        filter = InterruptionFilter(ignore_list=["yeah", "ok", "yeah ok"])
+        
+        # Exponential backtracking would make this hang
+        assert filter.is_ignore_list_only(" ".join(["yeah ok"] * 200) + " stop") is False
+        assert filter.is_ignore_list_only(" ".join(["yeah ok"] * 200)) is True
+        
+        # A split exists even though the longest phrase at "go" leads nowhere
+        filter = InterruptionFilter(ignore_list=["go", "go on", "on top"])
+        assert filter.is_ignore_list_only("go on top") is True
+        assert filter.is_ignore_list_only("go on top go") is True
+        assert filter.is_ignore_list_only("go top") is False
 
 
 class TestInterruptionFilterHasCommandWords:
@@ -274,6 +449,115 @@ class TestInterruptionFilterHasCommandWords:
         assert filter.has_command_words("   ") is False
 
 
+class TestInterruptionFilterClassify:
+    """Tests for the fused _classify helper."""
+    
+    def test_classify_matches_public_predicates(self):
+        """Test _classify agrees with is_ignore_list_only and has_command_words."""
+        filter = InterruptionFilter(ignore_list=["yeah", "ok", "hmm"])
+        
+        for text in ["Yeah", "yeah OK!", "yeah but wait", "stop", "", "   ", "..."]:
+            has_words, ignore_only, has_command = filter._classify(filter._normalize_text(text))
+            assert ignore_only is filter.is_ignore_list_only(text)
+            assert has_command is filter.has_command_words(text)
+            assert has_words is (ignore_only or has_command)
+    
+    def test_classify_long_transcripts(self):
+        """Test long utterances, with phrases and a trailing command, classify correctly."""
+        filter = InterruptionFilter()
+        
+        backchannel = " ".join(["yeah ok, uh huh, right"] * 50)
+        command = " ".join(["could you please explain that part again"] * 50)
+        
+        assert filter._classify(backchannel) == (True, True, False)
+        assert filter._classify(command) == (True, False, True)
+        assert filter._classify(backchannel + " stop") == (True, False, True)
+    
+
+
+    def test_memo_is_bounded(self):
+        """Test the classification memo evicts its oldest entry when full."""
+        filter = InterruptionFilter(ignore_list=["yeah", "ok"])
+        
+        for i in range(_CLASSIFY_CACHE_SIZE + 1):
+            filter.is_ignore_list_only(f"yeah {i}")
+        
+        assert len(filter._classify_memo) == _CLASSIFY_CACHE_SIZE
+        assert "yeah 0" not in filter._classify_memo
+    
+
+
+    def test_classify_is_memoized(self):
+        """Test repeated transcripts are served from the per-instance cache."""
+        filter = InterruptionFilter(ignore_list=["yeah", "ok"])
+        
+        for transcription in ["yeah ok", "Yeah OK", "YEAH ok"]:
+            decision = filter.should_filter_interruption(
+                transcription=transcription,
+                agent_state="speaking",
+                agent_speaking=True
+            )
+            assert decision.action == FilterAction.FILTER
+        
+        assert list(filter._classify_memo) == ["yeah ok"]
+        assert len(filter._decision_memo) == 3
+
+
+class TestInterruptionFilterDecisionCache:
+    """Tests for memoized and shared decisions."""
+    
+    def test_speaking_decisions_are_memoized(self):
+        """Test repeated transcripts return the cached, read-only decision."""
+        filter = InterruptionFilter(ignore_list=["yeah", "ok"])
+        
+        first = filter.should_filter_interruption("yeah ok", "speaking", True)
+        second = filter.should_filter_interruption("yeah ok", "speaking", True)
+        
+        assert first is second
+        assert first.metadata["transcription"] == "yeah ok"
+        with pytest.raises(TypeError):
+            first.metadata["transcription"] = "changed"
+    
+    def test_decision_cache_skips_long_and_eventless(self):
+        """Test long transcripts and eventless filters never fill the decision cache."""
+        filter = InterruptionFilter(ignore_list=["yeah", "ok"])
+        long_command = "please stop and go back to the previous slide for a moment"
+        
+        filter.should_filter_interruption(long_command, "speaking", True)
+        assert filter._decision_memo == {}
+        assert filter._classify_memo == {}
+        
+        eventless = InterruptionFilter(ignore_list=["yeah", "ok"], emit_events=False)
+        decision = eventless.should_filter_interruption("yeah ok", "speaking", True)
+        assert decision.action == FilterAction.FILTER
+        assert eventless._decision_memo == {}
+        assert list(eventless._classify_memo) == ["yeah ok"]
+    
+    def test_shared_decisions_are_read_only(self):
+        """Test decisions shared between filters reject metadata writes."""
+        silent = InterruptionFilter().should_filter_interruption("yeah", "listening", False)
+        custom = InterruptionFilter(
+            custom_filter_fn=lambda text, state: True
+        ).should_filter_interruption("yeah", "speaking", True)
+        
+        for decision in (silent, custom):
+            with pytest.raises(TypeError):
+                decision.metadata["agent_speaking"] = True
+    
+    def test_filter_freed_without_gc(self):
+        """Test a dropped filter is freed by refcounting, not the cyclic GC."""
+        filter = InterruptionFilter(ignore_list=["yeah", "ok"])
+        filter.should_filter_interruption("yeah ok", "speaking", True)
+        ref = weakref.ref(filter)
+        
+        gc.disable()
+        try:
+            del filter
+            assert ref() is None
+        finally:
+            gc.enable()
+
+
 class TestInterruptionFilterShouldFilterInterruption:
     """Tests for should_filter_interruption method."""
     
@@ -303,6 +587,16 @@ class TestInterruptionFilterShouldFilterInterruption:
         assert decision.action == FilterAction.ALLOW
         assert "not speaking" in decision.reason.lower()
     
+    def test_agent_not_speaking_skips_disabled_check_but_runs_custom(self):
+        """Test silent-agent input is allowed up front, but custom filters still run."""
+        disabled = InterruptionFilter(enabled=False)
+        decision = disabled.should_filter_interruption("yeah", "listening", False)
+        assert decision.action == FilterAction.ALLOW
+        
+        custom = InterruptionFilter(custom_filter_fn=lambda text, state: state == "listening")
+        decision = custom.should_filter_interruption("yeah", "listening", False)
+        assert decision.action == FilterAction.FILTER
+    
     def test_agent_speaking_backchanneling_filtered(self):
         """Test filter blocks backchanneling when agent speaking."""
         filter = InterruptionFilter(ignore_list=["yeah", "ok", "hmm"])
@@ -316,6 +610,39 @@ class TestInterruptionFilterShouldFilterInterruption:
         assert decision.action == FilterAction.FILTER
         assert "backchanneling" in decision.reason.lower()
     
+    def test_agent_speaking_single_token_filtered(self):
+        """Test a lone punctuated backchannel takes the fast path to FILTER."""
+        filter = InterruptionFilter()
+        
+        for transcription in ["ok", " Yeah. ", "uh-huh!", "Hmm?"]:
+            decision = filter.should_filter_interruption(
+                transcription=transcription,
+                agent_state="speaking",
+                agent_speaking=True
+            )
+            assert decision.action == FilterAction.FILTER
+        
+        decision = filter.should_filter_interruption(
+            transcription="ok...stop",
+            agent_state="speaking",
+            agent_speaking=True
+        )
+        assert decision.action == FilterAction.ALLOW
+    
+    def test_single_token_extraction(self):
+        """Test _single_token trims punctuation/whitespace and rejects phrases."""
+        filter = InterruptionFilter()
+        
+        assert filter._single_token(" yeah!\n") == "yeah"
+        assert filter._single_token("uh-huh.") == "uh-huh"
+        assert filter._single_token("yeah ok") is None
+        assert filter._single_token("?!") is None
+        assert filter._single_token("_yeah_") == "_yeah_"
+        
+        decision = filter.should_filter_interruption("_yeah_", "speaking", True)
+        assert decision.action == FilterAction.ALLOW
+        assert filter.is_ignore_list_only("_yeah_") is False
+    
     def test_agent_speaking_command_allowed(self):
         """Test filter allows commands when agent speaking."""
         filter = InterruptionFilter(ignore_list=["yeah", "ok"])
@@ -342,6 +669,44 @@ class TestInterruptionFilterShouldFilterInterruption:
         assert decision.action == FilterAction.ALLOW
         assert "command" in decision.reason.lower()
     
+    def test_decision_metadata_is_json_serializable(self):
+        """Test transcript-carrying and shared metadata serialize to JSON."""
+        filter = InterruptionFilter(ignore_list=["yeah", "ok"])
+        
+        backchannel = filter.should_filter_interruption(
+            transcription="yeah ok",
+            agent_state="speaking",
+            agent_speaking=True
+        )
+        silent = filter.should_filter_interruption(
+            transcription="stop",
+            agent_state="listening",
+            agent_speaking=False
+        )
+        
+        assert json.loads(json.dumps(backchannel.metadata))["transcription"] == "yeah ok"
+        assert json.loads(json.dumps(silent.metadata)) == {"agent_speaking": False}
+    
+    def test_emit_events_disabled_omits_metadata(self):
+        """Test decisions carry no transcript metadata when events are off."""
+        filter = InterruptionFilter(ignore_list=["yeah", "ok"], emit_events=False)
+        
+        backchannel = filter.should_filter_interruption(
+            transcription="yeah ok",
+            agent_state="speaking",
+            agent_speaking=True
+        )
+        command = filter.should_filter_interruption(
+            transcription="stop",
+            agent_state="speaking",
+            agent_speaking=True
+        )
+        
+        assert backchannel.action == FilterAction.FILTER
+        assert command.action == FilterAction.ALLOW
+        assert backchannel.metadata == {}
+        assert command.metadata == {}
+    
     def test_custom_filter_function(self):
         """Test custom filter function is used when provided."""
         def custom_filter(transcription: str, agent_state: str) -> bool:
@@ -369,6 +734,128 @@ class TestInterruptionFilterShouldFilterInterruption:
         )
         
         assert decision.action == FilterAction.ALLOW
+    
+    def test_custom_filter_error_falls_back(self):
+        """Test a raising custom filter falls back to the default logic."""
+        def broken_filter(transcription: str, agent_state: str) -> bool:
+            raise RuntimeError("boom")
+        
+        filter = InterruptionFilter(ignore_list=["yeah"], custom_filter_fn=broken_filter)
+        
+        assert filter.should_filter_interruption("yeah", "speaking", True).action == (
+            FilterAction.FILTER
+        )
+        assert filter.should_filter_interruption("stop", "speaking", True).action == (
+            FilterAction.ALLOW
+        )
+        assert filter.should_filter_interruption("yeah", "listening", False).action == (
+            FilterAction.ALLOW
+        )
+    
+    def test_custom_filter_keeps_subclass_override(self):
+        """Test a custom filter does not shadow an overridden should_filter_interruption."""
+        class Sub(InterruptionFilter):
+            def should_filter_interruption(self, transcription, agent_state, agent_speaking):
+                return "sub"
+        
+        filter = Sub(custom_filter_fn=lambda text, state: True)
+        
+        assert filter.should_filter_interruption("yeah", "speaking", True) == "sub"
+
+
+class TestInterruptionFilterClassifyBatch:
+    """Tests for classify_batch method."""
+    
+    def test_batch_matches_single_decisions(self):
+        """Test batch decisions equal per-call decisions, in order."""
+        filter = InterruptionFilter(ignore_list=["yeah", "ok"])
+        transcriptions = ["yeah", "stop", "yeah ok", "yeah", ""]
+        speaking = [True, True, True, False, True]
+        
+        decisions = filter.classify_batch(transcriptions, speaking)
+        
+        assert [d.action for d in decisions] == [
+            FilterAction.FILTER,
+            FilterAction.ALLOW,
+            FilterAction.FILTER,
+            FilterAction.ALLOW,
+            FilterAction.ALLOW,
+        ]
+        for decision, transcription, agent_speaking in zip(decisions, transcriptions, speaking):
+            assert decision == filter.should_filter_interruption(
+                transcription=transcription,
+                agent_state="speaking" if agent_speaking else "listening",
+                agent_speaking=agent_speaking
+            )
+    
+    def test_batch_length_mismatch(self):
+        """Test batch rejects mismatched input lengths."""
+        filter = InterruptionFilter()
+        
+        with pytest.raises(ValueError, match="one entry per transcription"):
+            filter.classify_batch(["yeah", "ok"], [True])
+
+
+class TestStreamingInterruptionClassifier:
+    """Tests for StreamingInterruptionClassifier."""
+    
+    def test_command_detected_before_final(self):
+        """Test a completed command word in a partial yields ALLOW once."""
+        classifier = StreamingInterruptionClassifier(InterruptionFilter())
+        
+        assert classifier.feed("yeah", agent_speaking=True) is None
+        assert classifier.feed("yeah wa", agent_speaking=True) is None
+        
+        decision = classifier.feed("yeah wait ", agent_speaking=True)
+        assert decision is not None
+        assert decision.action == FilterAction.ALLOW
+        assert decision.metadata["partial"] is True
+        with pytest.raises(TypeError):
+            decision.metadata["partial"] = False
+        assert json.loads(json.dumps(decision.metadata))["partial"] is True
+        
+        assert classifier.feed("yeah wait a second", agent_speaking=True) is None
+    
+    def test_backchannels_not_decided_early(self):
+        """Test ignore words and phrase fragments never trigger early ALLOW."""
+        classifier = StreamingInterruptionClassifier(InterruptionFilter())
+        
+        for partial in ["uh ", "uh huh ", "uh huh yeah ", "uh huh yeah i ", "uh huh yeah i see "]:
+            assert classifier.feed(partial, agent_speaking=True) is None
+    
+    def test_revised_partial_is_rescanned(self):
+        """Test a revision of already-scanned words is scanned again."""
+        classifier = StreamingInterruptionClassifier(InterruptionFilter())
+        
+        assert classifier.feed("yeah ok ", agent_speaking=True) is None
+        assert classifier.feed("yes stop ", agent_speaking=True) is not None
+    
+    def test_long_word_rejected_by_length(self):
+        """Test a word longer than every ignore word is a command on length alone."""
+        interruption_filter = InterruptionFilter(ignore_list=["ok"])
+        classifier = StreamingInterruptionClassifier(interruption_filter)
+        assert len("wait") > interruption_filter._max_ignore_len
+        
+        assert classifier.feed("ok ", agent_speaking=True) is None
+        decision = classifier.feed("ok wait ", agent_speaking=True)
+        assert decision is not None
+        assert decision.action == FilterAction.ALLOW
+        
+        classifier.reset()
+        decision = classifier.feed("ok no ", agent_speaking=True)
+        assert decision is not None
+        assert decision.action == FilterAction.ALLOW
+    
+    def test_reset_and_agent_silent(self):
+        """Test reset re-arms the classifier and silence never preempts."""
+        classifier = StreamingInterruptionClassifier(InterruptionFilter())
+        
+        assert classifier.feed("stop now", agent_speaking=False) is None
+        assert classifier.feed("stop now", agent_speaking=True) is not None
+        assert classifier.feed("stop now", agent_speaking=True) is None
+        
+        classifier.reset()
+        assert classifier.feed("stop now", agent_speaking=True) is not None
 
 
 if __name__ == "__main__":